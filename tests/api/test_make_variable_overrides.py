@@ -181,6 +181,26 @@ class TestTypecheckerVariable:
         assert "exit 1" in proc.stdout
 
 
+class TestStressWorkersVariable:
+    """STRESS_WORKERS opts 'make stress' into pytest-xdist sharding (default: 0, in-process)."""
+
+    def test_default_runs_in_process(self, logger) -> None:
+        """With no override, the sharding branch must be switched off."""
+        proc = run_make(logger, ["stress"])
+        assert 'if [ "0" != "0" ]' in proc.stdout
+
+    def test_empty_value_runs_in_process(self, logger) -> None:
+        """STRESS_WORKERS= (empty) must fall back to 0 rather than emit a bare '-n'."""
+        proc = run_make(logger, ["stress", "STRESS_WORKERS="])
+        assert 'if [ "0" != "0" ]' in proc.stdout
+
+    def test_worker_count_selects_sharding_branch(self, logger) -> None:
+        """STRESS_WORKERS=2 must switch the sharding branch on with that worker count."""
+        proc = run_make(logger, ["stress", "STRESS_WORKERS=2"])
+        assert 'if [ "2" != "0" ]' in proc.stdout
+        assert "-n 2 --dist loadfile" in proc.stdout
+
+
 class TestUvNoModifyPath:
     """UV_NO_MODIFY_PATH must always be exported to 1 to avoid uv touching PATH."""
 
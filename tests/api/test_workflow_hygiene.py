@@ -27,7 +27,8 @@ import re
 from pathlib import Path
 
 import pytest
-import yaml
+
+from tests.util import load_yaml
 
 _ROOT = Path(__file__).resolve().parents[2]
 
@@ -63,12 +64,6 @@ _WORKFLOWS = _workflow_files()
 _IDS = [str(p.relative_to(_ROOT)) for p in _WORKFLOWS]
 
 
-def _load(path: Path) -> dict:
-    """Load a workflow YAML file and return the parsed document."""
-    with path.open(encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
-
-
 def _uses_refs(workflow: dict) -> list[str]:
     """Return every ``uses:`` reference in a workflow (job-level and step-level)."""
     refs: list[str] = []
@@ -102,7 +97,7 @@ class TestWorkflowConcurrency:
     @pytest.mark.parametrize("workflow_file", _WORKFLOWS, ids=_IDS)
     def test_has_concurrency_group(self, workflow_file: Path) -> None:
         """Job-running workflows declare a concurrency group; caller stubs must not."""
-        workflow = _load(workflow_file)
+        workflow = load_yaml(workflow_file)
         concurrency = workflow.get("concurrency")
         if _delegates_to_reusable(workflow):
             assert concurrency is None, (
@@ -126,7 +121,7 @@ class TestWorkflowConcurrency:
         deadlocks the run), so for them this asserts the block stays absent
         rather than checking a cancel-in-progress value.
         """
-        workflow = _load(workflow_file)
+        workflow = load_yaml(workflow_file)
         if _delegates_to_reusable(workflow):
             assert workflow.get("concurrency") is None, (
                 f"{workflow_file.name}: reusable-workflow caller must not declare a "
@@ -150,7 +145,7 @@ class TestActionPinning:
         """All uses: refs must carry an exact vX.Y.Z tag or a full commit SHA."""
         imprecise = [
             ref
-            for ref in _uses_refs(_load(workflow_file))
+            for ref in _uses_refs(load_yaml(workflow_file))
             if not ref.startswith("./") and not _PRECISE_REF_RE.search(ref)
         ]
         assert not imprecise, (
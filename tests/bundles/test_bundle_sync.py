@@ -18,6 +18,12 @@ import yaml
 
 from tests.util import sync_bundles
 
+# A make rule header: a lowercase target name followed by `:` or `::`, then either
+# prerequisites/a comment (`_RULE_RE`) or nothing at all (`_RULE_OR_BARE_RE`).
+# Compiled once here because both are applied to every line of every synced fragment.
+_RULE_RE = re.compile(r"^[a-z][a-z0-9-]*::? ")
+_RULE_OR_BARE_RE = re.compile(r"^[a-z][a-z0-9-]*::?(?: |$)")
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -786,7 +792,7 @@ class TestALayersAllIsSatisfiableOnItsOwn:
             line.split(":", 1)[0].rstrip(":")
             for body in text.values()
             for line in body.splitlines()
-            if re.match(r"^[a-z][a-z0-9-]*::? ", line) or re.match(r"^[a-z][a-z0-9-]*::?$", line)
+            if _RULE_OR_BARE_RE.match(line)
         }
 
         missing = [name for name in prerequisites if name not in defined]
@@ -826,7 +832,7 @@ class TestEveryLayerDefinesTheSameGateNames:
                 line.split(":", 1)[0]
                 for fragment in (project / ".rhiza").rglob("*.mk")
                 for line in fragment.read_text(encoding="utf-8").splitlines()
-                if re.match(r"^[a-z][a-z0-9-]*::? ", line)
+                if _RULE_RE.match(line)
             }
             if gate not in defined:
                 missing.append(layer)
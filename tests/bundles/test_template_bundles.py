@@ -26,7 +26,8 @@ from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
 
 import pytest
-import yaml
+
+from tests.util import load_yaml, walk_tree
 
 
 def _layers(bundles_data: dict) -> dict[str, str]:
@@ -48,41 +49,27 @@ def _bundle_dependency_graph(bundles: dict) -> dict[str, set[str]]:
 
 
 def _deployment_paths(bundle_dir: Path) -> list[str]:
-    """Return all deployment paths for files/symlinks in a bundle directory.
+    """Return all deployment paths for files/symlinks in a bundle directory."""
+    return [rel for rel, _ in walk_tree(bundle_dir)]
 
-    Walks the bundle dir shallowly for symlinks (each symlink is one entry)
-    and recursively for real sub-directories and files.
-    """
-    paths = []
-    for root, dirs, files in os.walk(bundle_dir, followlinks=False):
-        root_path = Path(root)
-        # Yield symlinks (both file- and dir-type)
-        for name in dirs[:]:
-            child = root_path / name
-            if child.is_symlink():
-                dirs.remove(name)  # don't recurse into symlinked dirs
-                paths.append(child.relative_to(bundle_dir).as_posix())
-        for name in files:
-            child = root_path / name
-            paths.append(child.relative_to(bundle_dir).as_posix())
-    return paths
+
+def _broken_symlinks(bundle_dir: Path) -> list[Path]:
+    """Return every symlink under a bundle directory whose target does not exist."""
+    return [
+        Path(entry.path) for _, entry in walk_tree(bundle_dir) if entry.is_symlink() and not os.path.exists(entry.path)
+    ]
 
 
 def _bundle_files_with_sources(bundle_dir: Path) -> list[tuple[str, str]]:
-    """Return (deployment path, source file path) pairs for files in a bundle."""
-    files_with_sources: list[tuple[str, str]] = []
-    for root, dirs, files in os.walk(bundle_dir, followlinks=False):
-        root_path = Path(root)
-        for name in dirs[:]:
-            child = root_path / name
-            if child.is_symlink():
-                dirs.remove(name)  # don't recurse into symlinked dirs
-        for name in files:
-            child = root_path / name
-            if child.is_symlink() and not child.exists():
-                continue
-            files_with_sources.append((child.relative_to(bundle_dir).as_posix(), str(child.resolve())))
-    return files_with_sources
+    """Return (deployment path, source file path) pairs for files in a bundle.
+
+    Symlinked dirs and broken symlinks are skipped; only symlinks pay for a stat.
+    """
+    return [
+        (rel, os.path.realpath(entry.path))
+        for rel, entry in walk_tree(bundle_dir)
+        if not entry.is_symlink() or os.path.isfile(entry.path)
+    ]
 
 
 class TestTemplateBundles:
@@ -99,8 +86,7 @@ class TestTemplateBundles:
         if not bundles_file.exists():
             pytest.skip("template-bundles.yml does not exist in this project")
 
-        with open(bundles_file) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(bundles_file)
 
         if not data or "bundles" not in data:
             pytest.fail("Invalid template-bundles.yml format - missing 'bundles' key")
@@ -153,13 +139,8 @@ class TestTemplateBundles:
             bundle_dir = bundles_root / name
             if not bundle_dir.is_dir():
                 continue
-            for root_dir, dirs, files in os.walk(bundle_dir, followlinks=False):
-                for entry in list(dirs) + files:
-                    path = Path(root_dir) / entry
-                    if path.is_symlink() and not path.exists():
-                        errors.append(
-                            f"  [{name}] broken symlink: {path.relative_to(bundles_root)} → {os.readlink(path)}"
-                        )
+            for path in _broken_symlinks(bundle_dir):
+                errors.append(f"  [{name}] broken symlink: {path.relative_to(bundles_root)} → {os.readlink(path)}")
         if errors:
             pytest.fail("\nBroken symlinks found in bundle dirs:\n" + "\n".join(errors))
 
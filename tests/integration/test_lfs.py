@@ -9,6 +9,7 @@ Tests the lfs-install, lfs-pull, lfs-track, and lfs-status targets.
 import pathlib
 import shutil
 import subprocess  # nosec
+import sys
 
 import pytest
 
@@ -22,6 +23,7 @@ if not _LFS_MK.exists():
 
 # Get make command once at module level
 MAKE = shutil.which("make") or "/usr/bin/make"
+GIT = shutil.which("git") or "/usr/bin/git"
 
 
 @pytest.fixture
@@ -30,17 +32,39 @@ def lfs_makefile(git_repo):
     return git_repo / ".rhiza" / "make.d" / "lfs.mk"
 
 
-@pytest.fixture
-def lfs_install_dry_run(git_repo, lfs_makefile):
-    """Run lfs-install in dry-run mode and return the result."""
+@pytest.fixture(scope="module")
+def lfs_install_dry_run(root, tmp_path_factory):
+    """Run lfs-install in dry-run mode once per module and return the result.
+
+    Six tests only inspect this output, so it is produced once against a bare copy of
+    the Makefiles rather than once per test against a full ``git_repo`` sandbox (bare
+    remote, clone, mocks, push). ``make -n`` prints the recipe without running it, so
+    the output is identical; the ``git init`` only keeps rhiza.mk's git lookups quiet.
+    """
+    if sys.platform == "win32":
+        pytest.skip("lfs-install is a POSIX make recipe; unsupported on Windows, as for git_repo")
+
+    project = tmp_path_factory.mktemp("lfs")
+    (project / ".rhiza").mkdir()
+    shutil.copy(root / "Makefile", project / "Makefile")
+    shutil.copy(root / ".rhiza" / "rhiza.mk", project / ".rhiza" / "rhiza.mk")
+    shutil.copytree(root / ".rhiza" / "make.d", project / ".rhiza" / "make.d")
+    subprocess.run([GIT, "init", "-q"], cwd=project, check=True)  # nosec
+
     return subprocess.run(  # nosec
         [MAKE, "-n", "lfs-install"],
-        cwd=git_repo,
+        cwd=project,
         capture_output=True,
         text=True,
     )
 
 
+def _assert_recipe_contains(result, *needles):
+    """Assert the dry-run output contains every needle, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in result.stdout]
+    assert not missing, f"lfs-install recipe lacks {missing}"
+
+
 def test_lfs_files_exist():
     """lfs.mk and LFS.md must be present in the bundle."""
     assert _LFS_MK.exists()
@@ -69,30 +93,29 @@ def test_lfs_install_dry_run(lfs_install_dry_run):
     """Test lfs-install target in dry-run mode."""
     assert lfs_install_dry_run.returncode == 0
     # Check that the command includes OS detection
-    assert "uname -s" in lfs_install_dry_run.stdout
-    assert "uname -m" in lfs_install_dry_run.stdout
+    _assert_recipe_contains(lfs_install_dry_run, "uname -s", "uname -m")
 
 
 def test_lfs_install_macos_logic(lfs_install_dry_run):
     """Test that lfs-install generates correct logic for macOS."""
     assert lfs_install_dry_run.returncode == 0
     # Verify macOS installation logic is present
-    assert "Darwin" in lfs_install_dry_run.stdout
-    assert "darwin-arm64" in lfs_install_dry_run.stdout
-    assert "darwin-amd64" in lfs_install_dry_run.stdout
-    assert ".local/bin" in lfs_install_dry_run.stdout
-    assert "curl" in lfs_install_dry_run.stdout
-    assert "github.com/git-lfs/git-lfs/releases" in lfs_install_dry_run.stdout
+    _assert_recipe_contains(
+        lfs_install_dry_run,
+        "Darwin",
+        "darwin-arm64",
+        "darwin-amd64",
+        ".local/bin",
+        "curl",
+        "github.com/git-lfs/git-lfs/releases",
+    )
 
 
 def test_lfs_install_linux_logic(lfs_install_dry_run):
     """Test that lfs-install generates correct logic for Linux."""
     assert lfs_install_dry_run.returncode == 0
     # Verify Linux installation logic is present
-    assert "Linux" in lfs_install_dry_run.stdout
-    assert "apt-get update" in lfs_install_dry_run.stdout
-    assert "apt-get install" in lfs_install_dry_run.stdout
-    assert "git-lfs" in lfs_install_dry_run.stdout
+    _assert_recipe_contains(lfs_install_dry_run, "Linux", "apt-get update", "apt-get install", "git-lfs")
 
 
 def test_lfs_pull_target(git_repo, logger, lfs_makefile):
@@ -138,8 +161,7 @@ def test_lfs_install_error_handling(lfs_install_dry_run):
     """Test that lfs-install includes error handling."""
     assert lfs_install_dry_run.returncode == 0
     # Verify error handling is present
-    assert "ERROR" in lfs_install_dry_run.stdout
-    assert "exit 1" in lfs_install_dry_run.stdout
+    _assert_recipe_contains(lfs_install_dry_run, "ERROR", "exit 1")
 
 
 def test_lfs_install_uses_github_api(lfs_install_dry_run):
@@ -151,8 +173,7 @@ def test_lfs_install_sudo_handling(lfs_install_dry_run):
     """Test that lfs-install handles sudo correctly on Linux."""
     assert lfs_install_dry_run.returncode == 0
     # Verify sudo logic is present
-    assert "sudo" in lfs_install_dry_run.stdout
-    assert "id -u" in lfs_install_dry_run.stdout
+    _assert_recipe_contains(lfs_install_dry_run, "sudo", "id -u")
 
 
 @pytest.mark.skipif(
@@ -13,12 +13,16 @@ These tests only verify that:
 3. Custom security patterns not covered by standard tools
 """
 
+import os
 import pathlib
 import re
 import tomllib
+from functools import cache
 
 import pytest
 
+from tests.util import walk_tree
+
 
 def _github_bundle_active(repo_root: pathlib.Path | None = None) -> bool:
     """Return True if the github bundle is included in .rhiza/template.yml.
@@ -62,6 +66,36 @@ _REQUIRES_GITHUB_BUNDLE = pytest.mark.skipif(
     "are not required",
 )
 
+_SCAN_EXCLUDED_DIRS = {".git", ".venv", ".idea", ".pytest_cache", ".ruff_cache", "__pycache__", "node_modules"}
+
+
+# Hand-written Python never gets this large; anything bigger is generated or vendored.
+_MAX_SCANNED_BYTES = 1024 * 1024
+
+
+@cache
+def _python_sources(repo_root: pathlib.Path) -> tuple[tuple[str, str], ...]:
+    """Return ``(path, content)`` for every ``.py`` file under *repo_root*, read once per session.
+
+    Several tests scan Python sources; sharing one walk and one read per file keeps the
+    cost independent of how many of them there are. Files over ``_MAX_SCANNED_BYTES``
+    are skipped before they are opened.
+    """
+    sources = []
+    for _, entry in walk_tree(repo_root, _SCAN_EXCLUDED_DIRS):
+        if entry.name.endswith(".py") and entry.is_file() and entry.stat().st_size <= _MAX_SCANNED_BYTES:
+            with open(entry.path, "rb") as f:
+                sources.append((entry.path, f.read().decode("utf-8", errors="replace")))
+    return tuple(sources)
+
+
+# chmod calls with world-writable modes (0o777, 0o776, 0o775, ...).
+_WORLD_WRITABLE_CHMOD_RE = re.compile(r"\.chmod\s*\(\s*0o77[0-9]")
+
+# Any one of these marks a conftest as documenting its security exceptions: a rule code
+# verbatim, or the word "security" in any case. One alternation scans the text once.
+_SECURITY_DOCS_RE = re.compile(r"S101|S603|S607|(?i:security)")
+
 
 class TestFileOperations:
     """Validate secure file handling practices."""
@@ -76,16 +110,10 @@ class TestFileOperations:
         """
         repo_root = pathlib.Path(__file__).parent.parent.parent
         violations = []
-        # Look for chmod calls with overly permissive modes (world-writable: 0o77x)
-        # We're specifically looking for 0o777, 0o776, 0o775, etc. (world-writable)
-        chmod_pattern = re.compile(r"\.chmod\s*\(\s*0o77[0-9]")
-
-        for py_file in repo_root.rglob("*.py"):
+        for path, content in _python_sources(repo_root):
             # Skip test files and virtual environment
-            if ".venv" not in str(py_file) and "test" not in str(py_file).lower():
-                content = py_file.read_text(encoding="utf-8")
-                if chmod_pattern.search(content):
-                    violations.append(str(py_file))
+            if ".venv" not in path and "test" not in path.lower() and _WORLD_WRITABLE_CHMOD_RE.search(content):
+                violations.append(path)
 
         assert not violations, (
             f"Found world-writable file permissions (0o77x) in production code:\n"
@@ -256,18 +284,14 @@ class TestSecurityConfiguration:
         exceptions are justified and understood.
         """
         repo_root = pathlib.Path(__file__).parent.parent.parent
-        conftest_files = list(repo_root.rglob("conftest.py"))
+        conftest_files = [
+            (path, content) for path, content in _python_sources(repo_root) if os.path.basename(path) == "conftest.py"
+        ]
 
         # For each conftest, verify it has security documentation
-        for conftest in conftest_files:
-            if ".venv" in str(conftest):
-                continue
-
-            content = conftest.read_text()
+        for conftest, content in conftest_files:
             # Check for security-related comments or docstrings
-            has_security_docs = (
-                "S101" in content or "S603" in content or "S607" in content or "security" in content.lower()
-            )
+            has_security_docs = _SECURITY_DOCS_RE.search(content) is not None
 
             assert has_security_docs, f"{conftest} should document security exceptions (S101/S603/S607)"
 
@@ -324,17 +348,14 @@ _PIPED_INSTALLER_RE = re.compile(
 )
 
 _SCANNED_SUFFIXES = {".mk", ".sh"}
-_SCAN_EXCLUDED_DIRS = {".git", ".venv", ".idea", ".pytest_cache", ".ruff_cache", "__pycache__", "node_modules"}
 
 
 def _shell_and_make_sources(repo_root: pathlib.Path) -> list[pathlib.Path]:
     """Return all Makefile, *.mk, and *.sh sources outside excluded directories."""
     return sorted(
-        path
-        for path in repo_root.rglob("*")
-        if path.is_file()
-        and (path.suffix in _SCANNED_SUFFIXES or path.name == "Makefile")
-        and not _SCAN_EXCLUDED_DIRS.intersection(path.relative_to(repo_root).parts)
+        pathlib.Path(entry.path)
+        for _, entry in walk_tree(repo_root, _SCAN_EXCLUDED_DIRS)
+        if entry.is_file() and (os.path.splitext(entry.name)[1] in _SCANNED_SUFFIXES or entry.name == "Makefile")
     )
 
 
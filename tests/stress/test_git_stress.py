@@ -37,7 +37,7 @@ def test_concurrent_git_status(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_git_status) for _ in range(concurrent_workers * 2)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
@@ -62,7 +62,7 @@ def test_concurrent_git_log(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_git_log) for _ in range(concurrent_workers * 2)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
@@ -116,7 +116,7 @@ def test_concurrent_git_diff(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_git_diff) for _ in range(concurrent_workers * 2)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
@@ -163,7 +163,7 @@ def test_concurrent_git_show(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_git_show) for _ in range(concurrent_workers)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
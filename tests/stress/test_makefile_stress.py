@@ -37,7 +37,7 @@ def test_concurrent_help_invocations(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_help) for _ in range(concurrent_workers * 2)]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
@@ -88,7 +88,7 @@ def test_concurrent_dry_run_operations(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(run_dry_run, target) for target in targets[: concurrent_workers * 2]]
-        results = [f.result() for f in concurrent.futures.as_completed(futures)]
+        results = [f.result() for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
@@ -139,7 +139,7 @@ def test_concurrent_variable_printing(root: Path, concurrent_workers: int):
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_workers) as executor:
         futures = [executor.submit(print_variable, var) for var in variables]
-        results = [f.result(timeout=30) for f in concurrent.futures.as_completed(futures)]
+        results = [f.result(timeout=30) for f in futures]
 
     success_rate = sum(results) / len(results)
     assert success_rate == 1.0, f"Expected 100% success rate, got {success_rate * 100:.1f}%"
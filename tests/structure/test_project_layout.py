@@ -8,9 +8,27 @@ expected files/directories exist, enabling other tests to locate resources
 reliably.
 """
 
+import os
+from functools import cache
+from pathlib import Path
+
 import pytest
 
 
+@cache
+def _root_entries(root: Path) -> frozenset[str]:
+    """Names present at the repository root, read with one directory scan.
+
+    The layout tests look up several top-level names; answering them from a single
+    scan replaces a stat per name. Like ``Path.exists``, a dangling symlink does not count.
+    Unlike ``Path.exists`` on a case-insensitive filesystem (default macOS, Windows), the
+    lookup is case-sensitive: ``Readme.md`` does not satisfy ``README.md``. That is the
+    check a Linux checkout applies anyway, so the stricter answer is the portable one.
+    """
+    with os.scandir(root) as entries:
+        return frozenset(e.name for e in entries if not e.is_symlink() or os.path.exists(e.path))
+
+
 class TestRootFixture:
     """Tests for the root fixture that provides repository root path."""
 
@@ -21,21 +39,23 @@ class TestRootFixture:
 
     def test_root_contains_expected_directories(self, root):
         """Root should contain all expected project directories."""
+        entries = _root_entries(root)
         required_dirs = [".rhiza"]
         # optional_dirs = ["src", "tests", "book"]  # src/ is optional (rhiza itself doesn't have one)
 
         for dirname in required_dirs:
-            assert (root / dirname).exists(), f"Required directory {dirname} not found"
+            assert dirname in entries, f"Required directory {dirname} not found"
 
         # Check that at least one CI directory exists (.github or .gitlab)
         ci_dirs = [".github", ".gitlab"]
-        if not any((root / ci_dir).exists() for ci_dir in ci_dirs):
+        if not any(ci_dir in entries for ci_dir in ci_dirs):
             pytest.fail(f"At least one CI directory from {ci_dirs} must exist")
 
         # Optional directories are not enforced in this shared layout test.
 
     def test_root_contains_expected_files(self, root):
         """Root should contain all expected configuration files."""
+        entries = _root_entries(root)
         required_files = [
             "pyproject.toml",
             "README.md",
@@ -48,8 +68,8 @@ class TestRootFixture:
         ]
 
         for filename in required_files:
-            assert (root / filename).exists(), f"Required file {filename} not found"
+            assert filename in entries, f"Required file {filename} not found"
 
-        missing_optional_files = [filename for filename in optional_files if not (root / filename).exists()]
+        missing_optional_files = [filename for filename in optional_files if filename not in entries]
         if missing_optional_files:
             pytest.skip("Optional files not present in this project: " + ", ".join(missing_optional_files))
@@ -7,9 +7,18 @@ import os
 import re
 import shutil
 import subprocess  # nosec B404
+from collections.abc import Collection, Iterator
+from functools import cache
 from pathlib import Path
 
 import pytest
+import yaml
+
+# libyaml's loader when PyYAML was built with it; same documents, parsed in C.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 _MAKE = shutil.which("make") or "/usr/bin/make"
 _GIT = shutil.which("git") or "/usr/bin/git"
@@ -21,6 +30,37 @@ def strip_ansi(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
+@cache
+def load_yaml(path: Path) -> dict:
+    """Parse a YAML file once per session and return the document.
+
+    Cached, so callers must treat the result as read-only: every caller shares the
+    same object.
+    """
+    return yaml.load(path.read_bytes(), Loader=_SafeLoader)
+
+
+def walk_tree(root: Path, prune: Collection[str] = ()) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield ``(relative POSIX path, DirEntry)`` for every non-directory entry under *root*.
+
+    Real sub-directories are recursed into unless their name is in *prune*; symlinks,
+    including ones to directories, are yielded as single entries and never followed.
+    Entry types come from ``os.scandir``'s cached ``d_type``, so the walk itself costs
+    no per-path stat, and pruned directories are never listed at all.
+    """
+    pending = [""]
+    while pending:
+        prefix = pending.pop()
+        with os.scandir(os.path.join(root, prefix)) as entries:
+            for entry in entries:
+                rel = f"{prefix}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in prune:
+                        pending.append(f"{rel}/")
+                else:
+                    yield rel, entry
+
+
 def run_make(
     logger: logging.Logger,
     args: list[str] | None = None,
@@ -122,3 +122,24 @@ def test_classify_dogfood_refuses_to_guess_a_dangling_symlink_with_two_owners(ro
         owners.append(owner)
 
     assert module._classify_dogfood(tmp_path, rel, {rel: owners}) == ("ambiguous", None)
+
+
+def test_bundle_index_keys_only_files_inside_a_bundle(root, tmp_path) -> None:
+    """Top-level strays, ``__pycache__`` and symlinked directories contribute no keys."""
+    module = _load_module(root)
+    bundles = tmp_path / "bundles"
+    (bundles / "core" / ".rhiza").mkdir(parents=True)
+    (bundles / "core" / "a.txt").write_text("a", encoding="utf-8")
+    (bundles / "core" / ".rhiza" / "rhiza.mk").write_text("mk", encoding="utf-8")
+    (bundles / "NOTES.md").write_text("stray", encoding="utf-8")
+    (bundles / "core" / "__pycache__").mkdir()
+    (bundles / "core" / "__pycache__" / "a.cpython-312.pyc").write_bytes(b"")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "b.txt").write_text("b", encoding="utf-8")
+    (bundles / "core" / "linked").symlink_to(outside, target_is_directory=True)
+
+    index = module._bundle_index(bundles)
+
+    assert sorted(index) == sorted(["a.txt", str(Path(".rhiza") / "rhiza.mk")])
+    assert index["a.txt"] == [bundles / "core" / "a.txt"]
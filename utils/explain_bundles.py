@@ -26,6 +26,13 @@ try:
 except ImportError:
     sys.exit("pyyaml is not installed — run: make install")
 
+# Prefer the libyaml-backed loader; PyYAML builds without the C extension fall back
+# to the pure-Python one, which parses the same documents, only slower.
+try:
+    from yaml import CSafeLoader as SafeLoader  # type: ignore[import-untyped]
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[import-untyped,assignment]
+
 BLUE = "\033[36m"
 BOLD = "\033[1m"
 GREEN = "\033[32m"
@@ -34,7 +41,7 @@ DIM = "\033[2m"
 RESET = "\033[0m"
 
 with open(".rhiza/template-bundles.yml") as f:
-    data = yaml.safe_load(f)
+    data = yaml.load(f, Loader=SafeLoader)
 
 bundles = data.get("bundles", {})
 profiles = data.get("profiles", {})
@@ -101,11 +101,21 @@ def _bundle_index(bundles_dir: Path) -> dict[str, list[Path]]:
         to the list of concrete bundle files at that path across all bundles.
     """
     index: dict[str, list[Path]] = {}
-    for path in bundles_dir.rglob("*"):
-        if not path.is_file() or "__pycache__" in path.parts:
-            continue
-        relative = Path(*path.relative_to(bundles_dir).parts[1:])  # drop the bundle name
-        index.setdefault(str(relative), []).append(path)
+    # An explicit scandir walk rather than rglob: DirEntry caches the type from the
+    # directory read, so telling files from directories costs no extra stat per entry.
+    # Symlinked directories are not descended into, matching rglob's "**" behaviour.
+    pending = [(str(bundles_dir), ())]
+    while pending:
+        directory, parts = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == "__pycache__":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, (*parts, entry.name)))
+                elif parts and entry.is_file():  # a file directly under bundles/ has no bundle
+                    relative = Path(*parts[1:], entry.name)  # drop the bundle name
+                    index.setdefault(str(relative), []).append(Path(entry.path))
     return index
 
 